@@ -3,11 +3,20 @@
 import click
 import asyncio
 import json
+import logging
+import os
 from datetime import datetime
 from pathlib import Path
 from hydra import HydraFree
 import webbrowser
 
+THREAT_ICONS = {
+    'critical': '🔴',
+    'high': '🟡',
+    'medium': '🟢',
+    'low': '⚪'
+}
+
 @click.group()
 def cli():
     """
@@ -37,7 +46,13 @@ def collect(competitors, heads):
     print("-" * 50)
     
     # Run collection
-    result = asyncio.run(hydra.collect_intelligence(competitors_list))
+    async def run_collection():
+        try:
+            return await hydra.collect_intelligence(competitors_list)
+        finally:
+            await hydra.close()
+    
+    result = run_async(run_collection())
     
     # Export dashboard data
     stats = hydra.export_dashboard()
@@ -77,12 +92,7 @@ def report(hours, format):
             print("No intelligence collected yet.")
         else:
             for intel in recent:
-                threat_icon = {
-                    'critical': '🔴',
-                    'high': '🟡', 
-                    'medium': '🟢',
-                    'low': '⚪'
-                }.get(intel.get('threat_level', 'low'), '⚪')
+                threat_icon = THREAT_ICONS.get(intel.get('threat_level', 'low'), '⚪')
                 
                 print(f"\n{threat_icon} [{intel['head']}] {intel['competitor']}")
                 print(f"   Discovery: {intel['discovery']}")
@@ -123,10 +133,12 @@ def serve(port):
     print("Press Ctrl+C to stop\n")
     
     from fastapi import FastAPI
+    from fastapi.middleware.gzip import GZipMiddleware
     from fastapi.responses import HTMLResponse, JSONResponse
     import uvicorn
     
     app = FastAPI(title="HYDRA Intelligence System")
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
     
     @app.get("/", response_class=HTMLResponse)
     async def root():
@@ -473,6 +485,8 @@ scraping:
   timeout: 30
   retries: 3
   use_cache: true
+  max_concurrent: 12   # Heads allowed to run at once during collect
+  head_timeout: 120    # Seconds before a single head is abandoned
 
 # Alert settings (optional)
 alerts:
@@ -491,6 +505,19 @@ alerts:
     print("2. Run: python hydra.py collect")
     print("3. View: python hydra.py dashboard")
 
+def run_async(coro):
+    """Run a coroutine, on uvloop when it is installed"""
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    # HYDRA_DEBUG=1 turns on asyncio debug mode, which logs any callback blocking the loop for >100ms
+    debug = os.environ.get("HYDRA_DEBUG", "").lower() not in ("", "0", "false")
+    if debug:
+        logging.basicConfig(level=logging.INFO)
+    return asyncio.run(coro, debug=debug)
+
 def generate_html_report(intelligence, hours):
     """Generate HTML report"""
     html = f"""
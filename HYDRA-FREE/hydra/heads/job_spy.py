@@ -1,98 +1,119 @@
 import asyncio
+import logging
+from dataclasses import asdict, dataclass, field
 from typing import List, Dict, Any
 from datetime import datetime
 import re
 
 from typing import Optional
 
+from hydra.heads.history import HistoryStore
+
+log = logging.getLogger(__name__)
+
+
+TECH_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), indicator)
+    for pattern, indicator in {
+        "react": "Frontend modernization",
+        "kubernetes": "Scaling infrastructure",
+        "rust": "Performance optimization",
+        "flutter": "Mobile expansion",
+        "ai|machine learning|ml": "AI investment",
+        "blockchain|web3|crypto": "Web3 pivot",
+        "salesforce": "Enterprise focus",
+        "aws|azure|gcp": "Cloud migration",
+    }.items()
+]
+
+
+@dataclass
+class JobAnalysis:
+    significant_changes: bool = False
+    new_departments: List[str] = field(default_factory=list)
+    tech_stack_changes: List[str] = field(default_factory=list)
+    expansion_locations: List[str] = field(default_factory=list)
+    hiring_velocity: int = 0
+    strategic_indicators: List[str] = field(default_factory=list)
+    estimated_burn_rate: float = 0
+
 
 class JobSpyHead:
     def __init__(self, brain=None):
         self.brain = brain
         self.name = "JobSpy"
         self.monitoring = False
-        self.job_history: Dict[str, List[Dict[str, Any]]] = {}
-        self.tech_patterns = {
-            "react": "Frontend modernization",
-            "kubernetes": "Scaling infrastructure",
-            "rust": "Performance optimization",
-            "flutter": "Mobile expansion",
-            "ai|machine learning|ml": "AI investment",
-            "blockchain|web3|crypto": "Web3 pivot",
-            "salesforce": "Enterprise focus",
-            "aws|azure|gcp": "Cloud migration",
-        }
+        self.job_history: Dict[str, List[Dict[str, Any]]] = HistoryStore()
 
     async def start_monitoring(self, competitors: List[str]):
         self.monitoring = True
         while self.monitoring:
-            for competitor in competitors:
-                try:
-                    jobs = await self.scrape_jobs(competitor)
-                    analysis = self.analyze_hiring_patterns(competitor, jobs)
-                    if analysis["significant_changes"]:
-                        await self.brain.process_intelligence(self.create_intelligence(competitor, analysis))
-                    self.job_history[competitor] = jobs
-                except Exception:
-                    pass
-                await asyncio.sleep(3600)
+            await asyncio.gather(*(self.scan_competitor(c) for c in competitors))
+            await asyncio.sleep(3600)
+
+    async def scan_competitor(self, competitor: str):
+        try:
+            jobs = await self.scrape_jobs(competitor)
+            analysis = await asyncio.to_thread(self.analyze_hiring_patterns, competitor, jobs)
+            if analysis.significant_changes:
+                await self.brain.process_intelligence(self.create_intelligence(competitor, analysis))
+            self.job_history[competitor] = jobs
+        except Exception as e:
+            log.warning("JobSpy scan failed for %s: %s", competitor, e)
 
     async def scrape_jobs(self, competitor: str) -> List[Dict[str, Any]]:
         # Placeholder: implement free sources later
         return []
 
-    def analyze_hiring_patterns(self, competitor: str, current_jobs: List[Dict[str, Any]]) -> Dict[str, Any]:
-        analysis: Dict[str, Any] = {
-            "significant_changes": False,
-            "new_departments": [],
-            "tech_stack_changes": [],
-            "expansion_locations": [],
-            "hiring_velocity": 0,
-            "strategic_indicators": [],
-            "estimated_burn_rate": 0,
-        }
+    def analyze_hiring_patterns(self, competitor: str, current_jobs: List[Dict[str, Any]]) -> JobAnalysis:
+        analysis = JobAnalysis()
         if competitor not in self.job_history:
             self.job_history[competitor] = current_jobs
             return analysis
         old_jobs = self.job_history[competitor]
-        current_depts = {job.get("department") for job in current_jobs}
+        current_depts = set()
+        requirements: List[str] = []
+        senior_roles = 0
+        for job in current_jobs:
+            current_depts.add(job.get("department"))
+            requirements.append(job.get("requirements", ""))
+            senior_roles += "senior" in job.get("title", "").lower()
         old_depts = {job.get("department") for job in old_jobs}
         new_depts = current_depts - old_depts
         if new_depts:
-            analysis["new_departments"] = list(new_depts)
-            analysis["significant_changes"] = True
-        all_requirements = " ".join([job.get("requirements", "") for job in current_jobs]).lower()
-        for pattern, indicator in self.tech_patterns.items():
-            if re.search(pattern, all_requirements):
-                if indicator not in analysis["tech_stack_changes"]:
-                    analysis["tech_stack_changes"].append(indicator)
-                    analysis["significant_changes"] = True
-        analysis["hiring_velocity"] = len(current_jobs) - len(old_jobs)
-        senior_roles = sum(1 for job in current_jobs if "senior" in job.get("title", "").lower())
-        analysis["estimated_burn_rate"] = (len(current_jobs) * 120000 + senior_roles * 50000) / 12
-        if analysis["hiring_velocity"] > 10:
-            analysis["strategic_indicators"].append("Rapid expansion phase")
-        if "AI" in analysis["tech_stack_changes"]:
-            analysis["strategic_indicators"].append("Building AI capabilities")
-        if any("sales" in (dept or "").lower() for dept in analysis["new_departments"]):
-            analysis["strategic_indicators"].append("Sales push incoming")
+            analysis.new_departments = list(new_depts)
+            analysis.significant_changes = True
+        all_requirements = " ".join(requirements)
+        for pattern, indicator in TECH_PATTERNS:
+            if pattern.search(all_requirements):
+                if indicator not in analysis.tech_stack_changes:
+                    analysis.tech_stack_changes.append(indicator)
+                    analysis.significant_changes = True
+        analysis.hiring_velocity = len(current_jobs) - len(old_jobs)
+        analysis.estimated_burn_rate = (len(current_jobs) * 120000 + senior_roles * 50000) / 12
+        if analysis.hiring_velocity > 10:
+            analysis.strategic_indicators.append("Rapid expansion phase")
+        if "AI" in analysis.tech_stack_changes:
+            analysis.strategic_indicators.append("Building AI capabilities")
+        if any("sales" in (dept or "").lower() for dept in analysis.new_departments):
+            analysis.strategic_indicators.append("Sales push incoming")
         return analysis
 
-    def create_intelligence(self, competitor: str, analysis: Dict[str, Any]):
+    def create_intelligence(self, competitor: str, analysis: JobAnalysis):
         threat = "low"
-        if analysis["hiring_velocity"] > 20:
+        if analysis.hiring_velocity > 20:
             threat = "critical"
-        elif analysis["hiring_velocity"] > 10:
+        elif analysis.hiring_velocity > 10:
             threat = "high"
-        elif analysis["tech_stack_changes"]:
+        elif analysis.tech_stack_changes:
             threat = "medium"
         discoveries: List[str] = []
-        if analysis["new_departments"]:
-            discoveries.append(f"New departments: {', '.join(analysis['new_departments'])}")
-        if analysis["tech_stack_changes"]:
-            discoveries.append(f"Tech focus: {', '.join(analysis['tech_stack_changes'][:3])}")
-        if analysis["hiring_velocity"] > 0:
-            discoveries.append(f"{analysis['hiring_velocity']} new positions")
+        if analysis.new_departments:
+            discoveries.append(f"New departments: {', '.join(analysis.new_departments)}")
+        if analysis.tech_stack_changes:
+            discoveries.append(f"Tech focus: {', '.join(analysis.tech_stack_changes[:3])}")
+        if analysis.hiring_velocity > 0:
+            discoveries.append(f"{analysis.hiring_velocity} new positions")
         discovery = "Hiring pattern change detected: " + "; ".join(discoveries)
         return {
             "head": self.name,
@@ -100,21 +121,21 @@ class JobSpyHead:
             "discovery": discovery,
             "threat_level": threat,
             "confidence": 0.85,
-            "data": analysis,
+            "data": asdict(analysis),
         }
 
-    def recommend_action(self, analysis: Dict[str, Any]) -> str:
-        if "AI investment" in analysis.get("tech_stack_changes", []):
+    def recommend_action(self, analysis: JobAnalysis) -> str:
+        if "AI investment" in analysis.tech_stack_changes:
             return "URGENT: Competitor building AI team. Accelerate your AI roadmap or acquire AI startup."
-        if analysis.get("hiring_velocity", 0) > 15:
+        if analysis.hiring_velocity > 15:
             return "Competitor in hypergrowth. Consider: 1) Poach talent 2) Prepare for aggressive competition"
-        if "Sales push incoming" in analysis.get("strategic_indicators", []):
+        if "Sales push incoming" in analysis.strategic_indicators:
             return "Competitor scaling sales. Strengthen customer relationships and lock contracts."
         return "Monitor situation. Update competitive battle cards."
 
     async def analyze(self, competitor: str) -> Dict[str, Any]:
         jobs: List[Dict[str, Any]] = await self.scrape_jobs(competitor)
-        analysis = self.analyze_hiring_patterns(competitor, jobs)
+        analysis = await asyncio.to_thread(self.analyze_hiring_patterns, competitor, jobs)
         self.job_history[competitor] = jobs
         return self.create_intelligence(competitor, analysis)
 
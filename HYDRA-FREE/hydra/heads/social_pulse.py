@@ -1,7 +1,33 @@
 import asyncio
+import logging
+import re
 from typing import List, Dict, Any
 from datetime import datetime
-from textblob import TextBlob
+from textblob.sentiments import PatternAnalyzer
+
+log = logging.getLogger(__name__)
+
+# TextBlob's default analyzer, shared so each mention skips building a TextBlob
+SENTIMENT = PatternAnalyzer()
+
+ISSUE_RE = re.compile(
+    r"(?P<tech>bug|broken)|(?P<price>expensive|price)|(?P<perf>slow|down)|(?P<support>support)",
+    re.IGNORECASE,
+)
+ISSUES = (
+    ("tech", "Technical issues mentioned"),
+    ("price", "Price complaints"),
+    ("perf", "Performance issues"),
+    ("support", "Support complaints"),
+)
+
+# Polarity in [-1, 1] is kept as a small int; 1/127 is finer than the signal
+SENTIMENT_SCALE = 127
+TREND_THRESHOLD = round(0.2 * SENTIMENT_SCALE)
+
+
+def quantize(score: float) -> int:
+    return round(score * SENTIMENT_SCALE)
 
 
 class SocialPulseHead:
@@ -9,43 +35,57 @@ class SocialPulseHead:
         self.brain = brain
         self.name = "SocialPulse"
         self.monitoring = False
-        self.sentiment_history: Dict[str, Dict[str, Any]] = {}
+        self.sentiment_history: Dict[str, int] = {}
         self.platforms = ["twitter", "reddit", "hackernews", "linkedin"]
 
-    async def start_monitoring(self, competitors: List[str]):
+    async def start_monitoring(self, competitors: List[str], max_concurrent: int = 64):
         self.monitoring = True
+        limit = asyncio.Semaphore(max_concurrent)
         while self.monitoring:
-            for competitor in competitors:
-                try:
-                    mentions = await self.gather_social_mentions(competitor)
-                    analysis = self.analyze_sentiment(competitor, mentions)
-                    if analysis["significant_change"]:
-                        await self.brain.process_intelligence(self.create_intelligence(competitor, analysis))
-                    self.sentiment_history[competitor] = analysis
-                except Exception:
-                    pass
-                await asyncio.sleep(1800)
+            await asyncio.gather(*(self.scan_competitor(c, limit) for c in competitors))
+            await asyncio.sleep(1800)
+
+    async def scan_competitor(self, competitor: str, limit: asyncio.Semaphore):
+        try:
+            async with limit:
+                mentions = await self.gather_social_mentions(competitor)
+            analysis = self.analyze_sentiment(competitor, mentions)
+            if analysis["significant_change"]:
+                await self.brain.process_intelligence(self.create_intelligence(competitor, analysis))
+            self.sentiment_history[competitor] = quantize(analysis["sentiment_score"])
+        except Exception as e:
+            log.warning("SocialPulse scan failed for %s: %s", competitor, e)
 
     async def gather_social_mentions(self, competitor: str) -> List[Dict[str, Any]]:
+        timestamp = datetime.now().isoformat()
+        results = await asyncio.gather(*(self.fetch_platform(p, competitor, timestamp) for p in self.platforms))
+        return [mention for mentions in results for mention in mentions]
+
+    async def fetch_platform(self, platform: str, competitor: str, timestamp: str) -> List[Dict[str, Any]]:
         # Placeholder for free sources later
-        return [
-            {
-                "text": f"{competitor} just raised prices again. Switching to alternative.",
-                "platform": "twitter",
-                "author": "user123",
-                "likes": 45,
-                "timestamp": datetime.now().isoformat(),
-                "sentiment": None,
-            },
-            {
-                "text": f"Love the new feature from {competitor}! Game changer!",
-                "platform": "reddit",
-                "author": "user456",
-                "likes": 120,
-                "timestamp": datetime.now().isoformat(),
-                "sentiment": None,
-            },
-        ]
+        if platform == "twitter":
+            return [
+                {
+                    "text": f"{competitor} just raised prices again. Switching to alternative.",
+                    "platform": "twitter",
+                    "author": "user123",
+                    "likes": 45,
+                    "timestamp": timestamp,
+                    "sentiment": None,
+                }
+            ]
+        if platform == "reddit":
+            return [
+                {
+                    "text": f"Love the new feature from {competitor}! Game changer!",
+                    "platform": "reddit",
+                    "author": "user456",
+                    "likes": 120,
+                    "timestamp": timestamp,
+                    "sentiment": None,
+                }
+            ]
+        return []
 
     def analyze_sentiment(self, competitor: str, mentions: List[Dict[str, Any]]) -> Dict[str, Any]:
         analysis: Dict[str, Any] = {
@@ -65,8 +105,7 @@ class SocialPulseHead:
             return analysis
         sentiments: List[float] = []
         for mention in mentions:
-            blob = TextBlob(mention["text"])  # -1..1
-            sentiment = blob.sentiment.polarity
+            sentiment = SENTIMENT.analyze(mention["text"]).polarity  # -1..1
             mention["sentiment"] = sentiment
             sentiments.append(sentiment)
             if sentiment > 0.1:
@@ -85,20 +124,14 @@ class SocialPulseHead:
                         "platform": mention["platform"],
                     }
                 )
-            text_lower = mention["text"].lower()
-            if "bug" in text_lower or "broken" in text_lower:
-                analysis["issues_detected"].append("Technical issues mentioned")
-            if "expensive" in text_lower or "price" in text_lower:
-                analysis["issues_detected"].append("Price complaints")
-            if "slow" in text_lower or "down" in text_lower:
-                analysis["issues_detected"].append("Performance issues")
-            if "support" in text_lower and sentiment < 0:
-                analysis["issues_detected"].append("Support complaints")
+            found = {match.lastgroup for match in ISSUE_RE.finditer(mention["text"])}
+            if sentiment >= 0:
+                found.discard("support")
+            analysis["issues_detected"].extend(issue for key, issue in ISSUES if key in found)
         analysis["sentiment_score"] = sum(sentiments) / len(sentiments) if sentiments else 0
         if competitor in self.sentiment_history:
-            old_score = self.sentiment_history[competitor].get("sentiment_score", 0)
-            change = analysis["sentiment_score"] - old_score
-            if abs(change) > 0.2:
+            change = quantize(analysis["sentiment_score"]) - self.sentiment_history[competitor]
+            if abs(change) > TREND_THRESHOLD:
                 analysis["significant_change"] = True
                 analysis["sentiment_trend"] = "improving" if change > 0 else "declining"
         return analysis
@@ -139,7 +172,7 @@ class SocialPulseHead:
     async def analyze(self, competitor: str) -> Dict[str, Any]:
         mentions = await self.gather_social_mentions(competitor)
         analysis = self.analyze_sentiment(competitor, mentions)
-        self.sentiment_history[competitor] = analysis
+        self.sentiment_history[competitor] = quantize(analysis["sentiment_score"])
         return self.create_intelligence(competitor, analysis)
 
 
@@ -1,30 +1,39 @@
 import asyncio
+import logging
 from typing import List, Dict, Any
 from datetime import datetime
 
 from typing import Dict, Any, List
 
+from hydra.heads.history import HistoryStore
+
+log = logging.getLogger(__name__)
+
 
 class TechRadarHead:
     def __init__(self, brain=None):
         self.brain = brain
         self.name = "TechRadar"
         self.monitoring = False
-        self.tech_fingerprints: Dict[str, Dict[str, Any]] = {}
+        self.tech_fingerprints: Dict[str, Dict[str, Any]] = HistoryStore()
 
-    async def start_monitoring(self, competitors: List[str]):
+    async def start_monitoring(self, competitors: List[str], max_concurrent: int = 64):
         self.monitoring = True
+        limit = asyncio.Semaphore(max_concurrent)
         while self.monitoring:
-            for competitor in competitors:
-                try:
-                    tech_stack = await self.detect_technologies(competitor)
-                    changes = self.analyze_tech_changes(competitor, tech_stack)
-                    if changes["significant_changes"]:
-                        await self.brain.process_intelligence(self.create_intelligence(competitor, changes))
-                    self.tech_fingerprints[competitor] = tech_stack
-                except Exception:
-                    pass
-                await asyncio.sleep(7200)
+            await asyncio.gather(*(self.scan_competitor(c, limit) for c in competitors))
+            await asyncio.sleep(7200)
+
+    async def scan_competitor(self, competitor: str, limit: asyncio.Semaphore):
+        try:
+            async with limit:
+                tech_stack = await self.detect_technologies(competitor)
+            changes = self.analyze_tech_changes(competitor, tech_stack)
+            if changes["significant_changes"]:
+                await self.brain.process_intelligence(self.create_intelligence(competitor, changes))
+            self.tech_fingerprints[competitor] = tech_stack
+        except Exception as e:
+            log.warning("TechRadar scan failed for %s: %s", competitor, e)
 
     async def detect_technologies(self, competitor: str) -> Dict[str, Any]:
         return {
@@ -53,7 +62,10 @@ class TechRadarHead:
         for category, techs in current_stack.items():
             if category == "detected_at":
                 continue
-            old_techs = set(old_stack.get(category, []))
+            old_list = old_stack.get(category, [])
+            if old_list == techs:
+                continue  # Stacks rarely change; skip building sets for the common case
+            old_techs = set(old_list)
             new_techs = set(techs)
             added = new_techs - old_techs
             removed = old_techs - new_techs
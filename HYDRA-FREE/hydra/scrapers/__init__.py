@@ -8,10 +8,26 @@ HYDRA Scraping System
 import os
 from typing import Dict, Any
 
+# lxml's C parser is much faster than html.parser; fall back when it isn't installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 
-async def scrape_intelligently(url: str, method: str = "auto") -> Dict[str, Any]:
+# HTTP/2 multiplexes concurrent requests to one host over a single connection; needs h2
+try:
+    import h2  # noqa: F401
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
+
+
+async def scrape_intelligently(url: str, method: str = "auto", client=None) -> Dict[str, Any]:
     """
     Smart scraping that uses the best available method
+
+    Pass a shared httpx.AsyncClient as `client` to reuse pooled connections.
     """
 
     # Check if we should use Bright Data
@@ -28,7 +44,7 @@ async def scrape_intelligently(url: str, method: str = "auto") -> Dict[str, Any]
 
     # Fallback to free scraping
     from hydra.scrapers.free_scraper import FreeScraper
-    scraper = FreeScraper()
+    scraper = FreeScraper(client=client)
     result = await scraper.scrape(url)
     print(f"✅ Scraped via free method: {url}")
     return result
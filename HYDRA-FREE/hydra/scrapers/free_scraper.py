@@ -1,17 +1,43 @@
 import httpx
 from bs4 import BeautifulSoup
 import asyncio
-from typing import Dict, Any, List
+from contextlib import asynccontextmanager
+from typing import Dict, Any, List, Optional
 import random
 import re
 
+from hydra.scrapers import HTML_PARSER
+
+# Pages past this size are truncated; the signals we look for live near the top
+MAX_BODY_BYTES = 256 * 1024
+
+TECH_KEYWORDS = (
+    'react', 'angular', 'vue', 'javascript', 'python', 'java', 'ruby',
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'postgresql', 'mongodb',
+    'redis', 'elasticsearch', 'kafka', 'rabbitmq', 'graphql', 'rest api',
+    'machine learning', 'artificial intelligence', 'blockchain', 'nodejs'
+)
+
+# Common price patterns
+PRICE_PATTERNS = [
+    re.compile(r'\$\s*(\d+(?:,\d{3})*(?:\.\d{2})?)', re.I),
+    re.compile(r'(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(?:USD|usd|\$)', re.I),
+    re.compile(r'(?:price|cost|fee)[:\s]+\$?\s*(\d+(?:,\d{3})*(?:\.\d{2})?)', re.I)
+]
+PRICE_CLASS_RE = re.compile(r'price|cost|fee', re.I)
+JOB_CLASS_RE = re.compile(r'job|position|career|opening', re.I)
+LOCATION_RE = re.compile(r'location|city|remote', re.I)
+
 class FreeScraper:
     """
     FREE web scraping - no Bright Data needed!
     This is what we'll use after the $250 credits run out.
     """
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        # Shared, connection-pooled client (optional)
+        self.client = client
+        
         # Rotate user agents to avoid detection
         self.user_agents = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
@@ -33,6 +59,15 @@ class FreeScraper:
             'Upgrade-Insecure-Requests': '1'
         }
     
+    @asynccontextmanager
+    async def session(self):
+        """Yield the shared client if we were given one, else a short-lived client"""
+        if self.client is not None:
+            yield self.client
+        else:
+            async with httpx.AsyncClient() as client:
+                yield client
+    
     async def scrape(self, url: str) -> Dict[str, Any]:
         """
         Smart scraping with multiple fallback methods
@@ -65,32 +100,46 @@ class FreeScraper:
     
     async def scrape_direct(self, url: str) -> Dict[str, Any]:
         """Direct HTTP request - fastest method"""
-        async with httpx.AsyncClient(
-            timeout=self.timeout,
-            follow_redirects=True,
-            headers=self.get_headers()
-        ) as client:
-            response = await client.get(url)
-            response.raise_for_status()
+        async with self.session() as client:
+            async with client.stream(
+                "GET",
+                url,
+                headers=self.get_headers(),
+                timeout=self.timeout,
+                follow_redirects=True
+            ) as response:
+                response.raise_for_status()
+                
+                # Read at most MAX_BODY_BYTES so huge pages can't stall the scrape
+                chunks = []
+                size = 0
+                async for chunk in response.aiter_bytes():
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size >= MAX_BODY_BYTES:
+                        break
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            body = b"".join(chunks)[:MAX_BODY_BYTES]
+            text = body.decode(response.encoding or "utf-8", errors="replace")
+            soup = BeautifulSoup(text, HTML_PARSER)
             
             # Extract useful data
             data = {
                 "url": url,
                 "status_code": response.status_code,
                 "title": soup.title.string if soup.title else "",
-                "html": response.text[:50000],  # First 50k chars
+                "html": text[:50000],  # First 50k chars
                 "headers": dict(response.headers),
             }
             
             # Extract specific data based on URL
-            if "pricing" in url.lower():
+            url_lower = url.lower()
+            if "pricing" in url_lower:
                 data["prices"] = self.extract_prices(soup)
-            if "jobs" in url.lower() or "careers" in url.lower():
+            if "jobs" in url_lower or "careers" in url_lower:
                 data["jobs"] = self.extract_jobs(soup)
-            if "about" in url.lower():
-                data["tech_stack"] = self.extract_tech_stack(response.text)
+            if "about" in url_lower:
+                data["tech_stack"] = self.extract_tech_stack(text)
             
             return data
     
@@ -125,14 +174,15 @@ class FreeScraper:
                 
                 await browser.close()
                 
-                soup = BeautifulSoup(content, 'html.parser')
+                soup = BeautifulSoup(content, HTML_PARSER)
+                url_lower = url.lower()
                 
                 return {
                     "url": url,
                     "title": title,
                     "html": content[:50000],
-                    "prices": self.extract_prices(soup) if "pricing" in url.lower() else [],
-                    "jobs": self.extract_jobs(soup) if "jobs" in url.lower() else []
+                    "prices": self.extract_prices(soup) if "pricing" in url_lower else [],
+                    "jobs": self.extract_jobs(soup) if "jobs" in url_lower else []
                 }
                 
         except ImportError:
@@ -164,7 +214,7 @@ class FreeScraper:
         """Use Archive.org as fallback"""
         archive_api = f"http://archive.org/wayback/available?url={url}"
         
-        async with httpx.AsyncClient() as client:
+        async with self.session() as client:
             response = await client.get(archive_api)
             data = response.json()
             
@@ -181,42 +231,35 @@ class FreeScraper:
     
     def extract_prices(self, soup: BeautifulSoup) -> List[float]:
         """Extract prices from HTML"""
-        prices = []
-        
-        # Common price patterns
-        price_patterns = [
-            r'\$\s*(\d+(?:,\d{3})*(?:\.\d{2})?)',
-            r'(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(?:USD|usd|\$)',
-            r'(?:price|cost|fee)[:\s]+\$?\s*(\d+(?:,\d{3})*(?:\.\d{2})?)'
-        ]
+        prices = set()  # Deduplicate as we go
         
         text = soup.get_text()
         
-        for pattern in price_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in PRICE_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
                 try:
                     # Clean and convert to float
                     price = float(match.replace(',', ''))
                     if 0 < price < 1000000:  # Reasonable price range
-                        prices.append(price)
+                        prices.add(price)
                 except:
                     continue
         
         # Also check specific elements
-        for element in soup.find_all(['span', 'div', 'p'], class_=re.compile(r'price|cost|fee', re.I)):
+        for element in soup.find_all(['span', 'div', 'p'], class_=PRICE_CLASS_RE):
             text = element.get_text()
-            for pattern in price_patterns:
-                matches = re.findall(pattern, text)
+            for pattern in PRICE_PATTERNS:
+                matches = pattern.findall(text)
                 for match in matches:
                     try:
                         price = float(match.replace(',', ''))
                         if 0 < price < 1000000:
-                            prices.append(price)
+                            prices.add(price)
                     except:
                         continue
         
-        return list(set(prices))  # Remove duplicates
+        return list(prices)
     
     def extract_jobs(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
         """Extract job postings"""
@@ -224,7 +267,7 @@ class FreeScraper:
         
         # Look for job listings
         job_elements = soup.find_all(['div', 'li', 'article'], 
-                                    class_=re.compile(r'job|position|career|opening', re.I))
+                                    class_=JOB_CLASS_RE)
         
         for element in job_elements[:20]:  # Limit to 20
             job = {
@@ -239,7 +282,7 @@ class FreeScraper:
                 job["title"] = title.get_text().strip()
             
             # Try to find location
-            location = element.find(text=re.compile(r'location|city|remote', re.I))
+            location = element.find(text=LOCATION_RE)
             if location:
                 job["location"] = location.strip()
             
@@ -250,21 +293,5 @@ class FreeScraper:
     
     def extract_tech_stack(self, html: str) -> List[str]:
         """Extract technology mentions"""
-        tech_keywords = [
-            'react', 'angular', 'vue', 'javascript', 'python', 'java', 'ruby',
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'postgresql', 'mongodb',
-            'redis', 'elasticsearch', 'kafka', 'rabbitmq', 'graphql', 'rest api',
-            'machine learning', 'artificial intelligence', 'blockchain', 'nodejs'
-        ]
-        
-        tech_found = []
         html_lower = html.lower()
-        
-        for tech in html_lower.split():
-            pass
-        
-        for tech in tech_keywords:
-            if tech in html_lower:
-                tech_found.append(tech)
-        
-        return tech_found
+        return [tech for tech in TECH_KEYWORDS if tech in html_lower]
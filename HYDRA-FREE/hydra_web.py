@@ -1,15 +1,20 @@
 # hydra_web.py - Full Web UI for HYDRA
 from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 import uvicorn
 import asyncio
+import json
 from hydra import HydraFree
 from datetime import datetime
 from pathlib import Path
 
 app = FastAPI(title="HYDRA Intelligence System")
 
+# Intelligence feeds are repetitive JSON; compress anything non-trivial
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Store hydra instance
 hydra = HydraFree()
 
@@ -396,6 +401,11 @@ HTML_TEMPLATE = """
 </html>
 """
 
+@app.on_event("shutdown")
+async def shutdown():
+    """Release pooled HTTP connections"""
+    await hydra.close()
+
 @app.get("/", response_class=HTMLResponse)
 async def home():
     """Main web interface"""
@@ -414,6 +424,21 @@ async def get_intelligence():
     """Get recent intelligence"""
     return JSONResponse(hydra.get_recent_intelligence(24))
 
+@app.get("/api/export")
+async def export_intelligence(hours: int = 24, format: str = "json"):
+    """Export intelligence as a JSON array or streamed NDJSON (one record per line)"""
+    if format == "json":
+        return JSONResponse(hydra.get_recent_intelligence(hours))
+    if format != "ndjson":
+        raise HTTPException(status_code=400, detail="format must be 'json' or 'ndjson'")
+    
+    async def stream_rows():
+        # Runs on the event loop thread, which owns the SQLite connection
+        for row in hydra.iter_recent_intelligence(hours):
+            yield json.dumps(row) + "\n"
+    
+    return StreamingResponse(stream_rows(), media_type="application/x-ndjson")
+
 @app.get("/api/stats")
 async def get_stats():
     """Get statistics"""
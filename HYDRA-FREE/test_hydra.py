@@ -142,6 +142,66 @@ async def test_hydra():
     dashboard_path = Path("dashboard/index.html")
     print_test("  Dashboard HTML", dashboard_path.exists())
 
+    # Test 9: Export API
+    print(f"\n{Colors.BOLD}📤 Testing Export API:{Colors.END}")
+    try:
+        import httpx
+        from hydra_web import app
+        # In-process on this loop; the app's SQLite connection belongs to this thread
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/api/export", params={"format": "json"})
+            print_test("  format=json", response.status_code == 200 and isinstance(response.json(), list))
+
+            response = await client.get("/api/export", params={"format": "ndjson"})
+            rows = [json.loads(line) for line in response.text.splitlines() if line]
+            print_test("  format=ndjson", response.status_code == 200
+                       and response.headers["content-type"].startswith("application/x-ndjson")
+                       and all(isinstance(row, dict) for row in rows))
+
+            response = await client.get("/api/export", params={"format": "xml"})
+            print_test("  Unknown format rejected", response.status_code == 400)
+    except Exception as e:
+        print_test(f"  Export API error: {e}", False)
+
+    # Test 10: Price change math
+    print(f"\n{Colors.BOLD}💲 Testing Price Changes:{Colors.END}")
+    try:
+        from hydra.heads.price_watch import percent_change
+        print_test("  10 -> 12 is +20%", percent_change(10.0, 12.0) == 20.0)
+        print_test("  Zero old price gives 0%", percent_change(0.0, 12.0) == 0.0)
+    except Exception as e:
+        print_test(f"  percent_change error: {e}", False)
+
+    # Test 11: Retry on 429/503
+    print(f"\n{Colors.BOLD}🔁 Testing Fetch Retries:{Colors.END}")
+    try:
+        import httpx
+        from hydra.heads.price_watch import PriceWatchHead, MAX_ATTEMPTS
+        calls = []
+
+        def flaky(request):
+            # Retry-After: 0 keeps the backoff out of the test run
+            calls.append(request.url.path)
+            if request.url.path == "/down" or len(calls) < 3:
+                return httpx.Response(503, headers={"Retry-After": "0"})
+            return httpx.Response(200, text="ok")
+
+        head = PriceWatchHead()
+        head.own_client = httpx.AsyncClient(transport=httpx.MockTransport(flaky))
+        response = await head.get_with_retry("https://test.com/products")
+        print_test("  Recovers after 503s", response.status_code == 200 and len(calls) == 3)
+
+        calls.clear()
+        try:
+            await head.get_with_retry("https://test.com/down")
+            print_test("  Raises once retries run out", False)
+        except httpx.HTTPStatusError:
+            print_test("  Raises once retries run out", len(calls) == MAX_ATTEMPTS)
+        await head.aclose()
+    except Exception as e:
+        print_test(f"  Retry error: {e}", False)
+
     print(f"""
     {Colors.BOLD}
     ════════════════════════════════════════════════
@@ -1,10 +1,20 @@
 import sqlite3
 import json
 import asyncio
+import importlib
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 import yaml
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
+
+
+# Heads runnable by collect_intelligence: name -> (module, class), imported on first use
+HEADS = {
+    "PriceWatch": ("hydra.heads.price_watch", "PriceWatchHead"),
+    "JobSpy": ("hydra.heads.job_spy", "JobSpyHead"),
+    "TechRadar": ("hydra.heads.tech_radar", "TechRadarHead"),
+}
 
 
 class HydraFree:
@@ -13,6 +23,8 @@ class HydraFree:
     def __init__(self, config_path: str = "config.yaml"):
         self.config = self.load_config(config_path)
         self.db = self.init_database()
+        self.heads: Dict[str, Any] = {}
+        self._http = None
         
     def load_config(self, path: str) -> Dict:
         if Path(path).exists():
@@ -24,6 +36,25 @@ class HydraFree:
             "use_bright_data": False
         }
     
+    @property
+    def http(self):
+        """Connection-pooled HTTP client shared by every head"""
+        if self._http is None:
+            import httpx
+            from hydra.scrapers import HTTP2
+            self._http = httpx.AsyncClient(
+                http2=HTTP2,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                timeout=httpx.Timeout(30.0, connect=10.0)
+            )
+        return self._http
+    
+    async def close(self):
+        """Release pooled HTTP connections"""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+    
     def init_database(self) -> sqlite3.Connection:
         conn = sqlite3.connect("hydra.db")
         conn.execute('''
@@ -59,53 +90,82 @@ class HydraFree:
         self.db.commit()
     
     def get_recent_intelligence(self, hours: int = 24) -> List[Dict]:
+        return list(self.iter_recent_intelligence(hours))
+    
+    def iter_recent_intelligence(self, hours: int = 24, batch_size: int = 500) -> Iterator[Dict]:
+        """Yield recent intelligence in batches instead of loading every row at once"""
         cursor = self.db.execute(f'''
             SELECT * FROM intelligence 
             WHERE datetime(timestamp) > datetime('now', '-{hours} hours')
             ORDER BY timestamp DESC
         ''')
         columns = [c[0] for c in cursor.description]
-        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(zip(columns, row))
+    
+    def get_head(self, head_name: str):
+        """Return the head instance for a name, creating it once per HydraFree"""
+        head = self.heads.get(head_name)
+        if head is None and head_name in HEADS:
+            module_name, class_name = HEADS[head_name]
+            head_class = getattr(importlib.import_module(module_name), class_name)
+            head = self.heads[head_name] = head_class(self)
+        return head
+    
+    async def run_head(self, head_name: str, competitor: str) -> Dict:
+        """Run a single head against a single competitor"""
+        head = self.get_head(head_name)
+        if head is None:
+            return None
+        
+        return await head.analyze(competitor)
     
     async def collect_intelligence(self, competitors: List[str] = None):
         """Collect real intelligence using all heads"""
-        from hydra.scrapers import scrape_intelligently
-        
         competitors = competitors or self.config['competitors']
+        head_names = self.config.get('heads', [])
         saved = 0
         
-        for competitor in competitors:
-            print(f"\n🎯 Analyzing {competitor}...")
-            
-            # Run each head
-            for head_name in self.config.get('heads', []):
+        # Cap in-flight heads and give each a deadline so one hung scrape can't stall the run
+        scraping = self.config.get('scraping') or {}
+        limit = asyncio.Semaphore(scraping.get('max_concurrent', 12))
+        head_timeout = scraping.get('head_timeout', 120)
+        
+        async def run_bounded(head_name: str, competitor: str):
+            async with limit:
                 try:
-                    # Import and run the head
-                    if head_name == "PriceWatch":
-                        from hydra.heads.price_watch import PriceWatchHead
-                        head = PriceWatchHead(self)
-                    elif head_name == "JobSpy":
-                        from hydra.heads.job_spy import JobSpyHead
-                        head = JobSpyHead(self)
-                    elif head_name == "TechRadar":
-                        from hydra.heads.tech_radar import TechRadarHead
-                        head = TechRadarHead(self)
-                    else:
-                        continue
+                    result = await asyncio.wait_for(self.run_head(head_name, competitor), head_timeout)
+                except asyncio.TimeoutError:
+                    result = TimeoutError(f"timed out after {head_timeout}s")
+                except Exception as e:
+                    result = e
+            return competitor, head_name, result
+        
+        print(f"\n🎯 Analyzing {', '.join(competitors)}...")
+        
+        # Run every (competitor, head) pair concurrently and handle each result as soon as it lands
+        pending = [run_bounded(head_name, competitor) for competitor in competitors for head_name in head_names]
+        for next_done in asyncio.as_completed(pending):
+            competitor, head_name, result = await next_done
+            
+            try:
+                if isinstance(result, Exception):
+                    raise result
+                
+                if result:
+                    self.save_intelligence(result)
+                    saved += 1
                     
-                    # Analyze with the head
-                    result = await head.analyze(competitor)
+                    # Print summary
+                    icon = "🔴" if result['threat_level'] == 'critical' else "🟡"
+                    print(f"  {icon} {competitor} / {head_name}: {result['discovery'][:60]}...")
                     
-                    if result:
-                        self.save_intelligence(result)
-                        saved += 1
-                        
-                        # Print summary
-                        icon = "🔴" if result['threat_level'] == 'critical' else "🟡"
-                        print(f"  {icon} {head_name}: {result['discovery'][:60]}...")
-                        
-                except Exception as e:
-                    print(f"  ❌ {head_name} failed: {e}")
+            except Exception as e:
+                print(f"  ❌ {competitor} / {head_name} failed: {e}")
         
         return saved
     
@@ -113,11 +173,18 @@ class HydraFree:
         Path("dashboard").mkdir(exist_ok=True)
         recent = self.get_recent_intelligence(24)
         
+        # One pass over the window instead of a separate scan per statistic
+        threat_counts = Counter()
+        competitors = set()
+        for intel in recent:
+            threat_counts[intel.get('threat_level')] += 1
+            competitors.add(intel['competitor'])
+        
         stats = {
             "total_discoveries": len(recent),
-            "critical_threats": sum(1 for i in recent if i.get('threat_level') == 'critical'),
-            "high_threats": sum(1 for i in recent if i.get('threat_level') == 'high'),
-            "competitors": list(set(i['competitor'] for i in recent)),
+            "critical_threats": threat_counts['critical'],
+            "high_threats": threat_counts['high'],
+            "competitors": list(competitors),
             "last_updated": datetime.now().isoformat()
         }
         
@@ -1,31 +1,73 @@
 import asyncio
+import logging
+import re
+from dataclasses import asdict, dataclass, field
 from typing import List, Dict, Any
 from datetime import datetime
 
 from typing import Dict, Any, List
 
+from hydra.heads.history import HistoryStore
+
+log = logging.getLogger(__name__)
+
+
+PROMO_RE = re.compile("sale|discount")
+LAUNCH_RE = re.compile("new|launch")
+# Indexed by the sign of a >30% spend move; -1 wraps to "decreasing".
+SPEND_TRENDS = ("stable", "increasing", "decreasing")
+
+PLATFORMS = ("google_ads", "facebook", "instagram", "linkedin", "youtube", "tiktok", "twitter")
+# One bit per known platform name; callers copy this and extend it per analysis.
+PLATFORM_BITS: Dict[str, int] = {name: 1 << i for i, name in enumerate(PLATFORMS)}
+
+
+def platform_mask(campaigns: List[Dict[str, Any]], bits: Dict[str, int]) -> int:
+    """Bitmask of the platforms a list of campaigns runs on.
+
+    Unknown platforms get the next free bit in ``bits``, which the caller owns.
+    """
+    mask = 0
+    for campaign in campaigns:
+        mask |= bits.setdefault(campaign["platform"], 1 << len(bits))
+    return mask
+
+
+@dataclass
+class AdAnalysis:
+    significant_changes: bool = False
+    spend_trend: str = "stable"
+    new_channels: List[str] = field(default_factory=list)
+    messaging_shift: str = ""
+    targeting_changes: List[str] = field(default_factory=list)
+    campaign_intensity: str = "normal"
+    predicted_goal: str = ""
+    opportunities: List[str] = field(default_factory=list)
+
 
 class AdTrackerHead:
     def __init__(self, brain=None):
         self.brain = brain
         self.name = "AdTracker"
         self.monitoring = False
-        self.campaign_history: Dict[str, Dict[str, Any]] = {}
-        self.platforms = ["google_ads", "facebook", "instagram", "linkedin", "youtube", "tiktok", "twitter"]
+        self.campaign_history: Dict[str, Dict[str, Any]] = HistoryStore()
+        self.platforms = list(PLATFORMS)
 
     async def start_monitoring(self, competitors: List[str]):
         self.monitoring = True
         while self.monitoring:
-            for competitor in competitors:
-                try:
-                    campaigns = await self.track_campaigns(competitor)
-                    analysis = self.analyze_ad_strategy(competitor, campaigns)
-                    if analysis["significant_changes"]:
-                        await self.brain.process_intelligence(self.create_intelligence(competitor, analysis))
-                    self.campaign_history[competitor] = campaigns
-                except Exception:
-                    pass
-                await asyncio.sleep(21600)
+            await asyncio.gather(*(self.scan_competitor(c) for c in competitors))
+            await asyncio.sleep(21600)
+
+    async def scan_competitor(self, competitor: str):
+        try:
+            campaigns = await self.track_campaigns(competitor)
+            analysis = await asyncio.to_thread(self.analyze_ad_strategy, competitor, campaigns)
+            if analysis.significant_changes:
+                await self.brain.process_intelligence(self.create_intelligence(competitor, analysis))
+            self.campaign_history[competitor] = campaigns
+        except Exception as e:
+            log.warning("AdTracker scan failed for %s: %s", competitor, e)
 
     async def track_campaigns(self, competitor: str) -> Dict[str, Any]:
         sample_campaign = {
@@ -48,17 +90,8 @@ class AdTrackerHead:
             "creative_formats": ["video"],
         }
 
-    def analyze_ad_strategy(self, competitor: str, campaigns: Dict[str, Any]) -> Dict[str, Any]:
-        analysis: Dict[str, Any] = {
-            "significant_changes": False,
-            "spend_trend": "stable",
-            "new_channels": [],
-            "messaging_shift": "",
-            "targeting_changes": [],
-            "campaign_intensity": "normal",
-            "predicted_goal": "",
-            "opportunities": [],
-        }
+    def analyze_ad_strategy(self, competitor: str, campaigns: Dict[str, Any]) -> AdAnalysis:
+        analysis = AdAnalysis()
         if not campaigns["active_campaigns"]:
             return analysis
         total_spend = sum(c.get("estimated_spend", 0) for c in campaigns["active_campaigns"])
@@ -66,71 +99,71 @@ class AdTrackerHead:
             old_campaigns = self.campaign_history[competitor]
             old_spend = sum(c.get("estimated_spend", 0) for c in old_campaigns.get("active_campaigns", []))
             spend_change = ((total_spend - old_spend) / old_spend * 100) if old_spend > 0 else 0
-            if abs(spend_change) > 30:
-                analysis["significant_changes"] = True
-                analysis["spend_trend"] = "increasing" if spend_change > 0 else "decreasing"
-            old_platforms = set(c["platform"] for c in old_campaigns.get("active_campaigns", []))
-            new_platforms = set(c["platform"] for c in campaigns["active_campaigns"])
-            new_channels = new_platforms - old_platforms
-            if new_channels:
-                analysis["new_channels"] = list(new_channels)
-                analysis["significant_changes"] = True
-        messages = [c.get("messaging", "") for c in campaigns["active_campaigns"]]
-        if any("sale" in m.lower() or "discount" in m.lower() for m in messages):
-            analysis["messaging_shift"] = "Promotional/discount focus"
-        elif any("new" in m.lower() or "launch" in m.lower() for m in messages):
-            analysis["messaging_shift"] = "Product launch"
+            sign = (spend_change > 30) - (spend_change < -30)
+            analysis.spend_trend = SPEND_TRENDS[sign]
+            analysis.significant_changes = sign != 0
+            bits = dict(PLATFORM_BITS)
+            old_mask = platform_mask(old_campaigns.get("active_campaigns", []), bits)
+            new_mask = platform_mask(campaigns["active_campaigns"], bits) & ~old_mask
+            if new_mask:
+                analysis.new_channels = [name for name, bit in bits.items() if new_mask & bit]
+                analysis.significant_changes = True
+        messages = "\n".join(c.get("messaging", "") for c in campaigns["active_campaigns"]).lower()
+        if PROMO_RE.search(messages):
+            analysis.messaging_shift = "Promotional/discount focus"
+        elif LAUNCH_RE.search(messages):
+            analysis.messaging_shift = "Product launch"
         if len(campaigns["active_campaigns"]) > 10:
-            analysis["campaign_intensity"] = "high"
-            analysis["significant_changes"] = True
+            analysis.campaign_intensity = "high"
+            analysis.significant_changes = True
         elif len(campaigns["active_campaigns"]) < 3:
-            analysis["campaign_intensity"] = "low"
-        if analysis["spend_trend"] == "increasing" and analysis["messaging_shift"] == "Product launch":
-            analysis["predicted_goal"] = "Major product launch - high competitive threat"
-        elif analysis["campaign_intensity"] == "high":
-            analysis["predicted_goal"] = "Market share grab attempt"
-        if analysis["spend_trend"] == "decreasing":
-            analysis["opportunities"].append("Competitor reducing ad spend - opportunity to gain visibility")
+            analysis.campaign_intensity = "low"
+        if analysis.spend_trend == "increasing" and analysis.messaging_shift == "Product launch":
+            analysis.predicted_goal = "Major product launch - high competitive threat"
+        elif analysis.campaign_intensity == "high":
+            analysis.predicted_goal = "Market share grab attempt"
+        if analysis.spend_trend == "decreasing":
+            analysis.opportunities.append("Competitor reducing ad spend - opportunity to gain visibility")
         return analysis
 
-    def create_intelligence(self, competitor: str, analysis: Dict[str, Any]):
+    def create_intelligence(self, competitor: str, analysis: AdAnalysis):
         threat = "low"
-        if analysis["campaign_intensity"] == "high" and analysis["spend_trend"] == "increasing":
+        if analysis.campaign_intensity == "high" and analysis.spend_trend == "increasing":
             threat = "critical"
-        elif analysis["significant_changes"]:
+        elif analysis.significant_changes:
             threat = "high"
-        elif analysis["new_channels"]:
+        elif analysis.new_channels:
             threat = "medium"
-        discovery = f"Ad activity: {analysis['campaign_intensity']}"
-        if analysis["spend_trend"] != "stable":
-            discovery += f" | Spend {analysis['spend_trend']}"
-        if analysis["new_channels"]:
-            discovery += f" | New channels: {', '.join(analysis['new_channels'])}"
-        if analysis["predicted_goal"]:
-            discovery += f" | Likely: {analysis['predicted_goal']}"
+        discovery = f"Ad activity: {analysis.campaign_intensity}"
+        if analysis.spend_trend != "stable":
+            discovery += f" | Spend {analysis.spend_trend}"
+        if analysis.new_channels:
+            discovery += f" | New channels: {', '.join(analysis.new_channels)}"
+        if analysis.predicted_goal:
+            discovery += f" | Likely: {analysis.predicted_goal}"
         return {
             "head": self.name,
             "competitor": competitor,
             "discovery": discovery,
             "threat_level": threat,
             "confidence": 0.85,
-            "data": analysis,
+            "data": asdict(analysis),
         }
 
-    def recommend_action(self, analysis: Dict[str, Any]) -> str:
-        if analysis["predicted_goal"] == "Major product launch - high competitive threat":
+    def recommend_action(self, analysis: AdAnalysis) -> str:
+        if analysis.predicted_goal == "Major product launch - high competitive threat":
             return "URGENT: Competitor launching major campaign. Deploy retention campaign."
-        if analysis["campaign_intensity"] == "high":
+        if analysis.campaign_intensity == "high":
             return "Competitor in aggressive marketing mode. Increase brand visibility."
-        if analysis["new_channels"]:
-            return f"Competitor expanding to {analysis['new_channels'][0]}. Evaluate channel."
-        if analysis["opportunities"]:
-            return analysis["opportunities"][0]
+        if analysis.new_channels:
+            return f"Competitor expanding to {analysis.new_channels[0]}. Evaluate channel."
+        if analysis.opportunities:
+            return analysis.opportunities[0]
         return "Monitor campaign changes. Maintain brand presence."
 
     async def analyze(self, competitor: str) -> Dict[str, Any]:
         campaigns = await self.track_campaigns(competitor)
-        analysis = self.analyze_ad_strategy(competitor, campaigns)
+        analysis = await asyncio.to_thread(self.analyze_ad_strategy, competitor, campaigns)
         self.campaign_history[competitor] = campaigns
         return self.create_intelligence(competitor, analysis)
 
@@ -0,0 +1,26 @@
+import threading
+from collections import OrderedDict
+from typing import Any
+
+
+# Enough for any realistic watch list; keeps long-running monitors bounded.
+HISTORY_MAX = 500
+
+
+class HistoryStore(OrderedDict):
+    """Per-competitor snapshots, evicting the least recently written entry.
+
+    Writes are locked because heads update history from analysis worker threads.
+    """
+
+    def __init__(self, maxsize: int = HISTORY_MAX):
+        super().__init__()
+        self.maxsize = maxsize
+        self.lock = threading.Lock()
+
+    def __setitem__(self, competitor: str, snapshot: Any):
+        with self.lock:
+            super().__setitem__(competitor, snapshot)
+            self.move_to_end(competitor)
+            if len(self) > self.maxsize:
+                self.popitem(last=False)
@@ -1,34 +1,68 @@
 import asyncio
+import logging
+import time
+from dataclasses import asdict, dataclass, field
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
 
 from typing import Dict, Any, List
 
+from hydra.heads.history import HistoryStore
+
+log = logging.getLogger(__name__)
+
+# Indexed by PatentAnalysis.threat_code.
+THREAT_LEVELS = ("low", "medium", "high")
+THREAT_ASSESSMENTS = ("LOW: Normal activity", "MEDIUM: Active filings", "HIGH: Rapid innovation pace")
+RECENT_WINDOW = 180 * 86400
+# Titles remembered per competitor; the oldest are forgotten first.
+SEEN_TITLES_MAX = 2000
+
+
+def filed_epoch(patent: Dict[str, Any]) -> float:
+    """Filing date as a POSIX timestamp."""
+    return datetime.fromisoformat(patent["filing_date"]).timestamp()
+
+
+@dataclass
+class PatentAnalysis:
+    total_patents: int = 0
+    new_filings: List[Dict[str, Any]] = field(default_factory=list)
+    technology_focus: Dict[str, int] = field(default_factory=dict)
+    strategic_shift: bool = False
+    innovation_velocity: float = 0
+    predicted_products: List[str] = field(default_factory=list)
+    threat_code: int = 0
+    threat_assessment: str = ""
+
 
 class PatentHawkHead:
     def __init__(self, brain=None):
         self.brain = brain
         self.name = "PatentHawk"
         self.monitoring = False
-        self.patent_history: Dict[str, List[Dict[str, Any]]] = {}
+        # Insertion-ordered dicts used as sets, so the oldest titles can be dropped
+        self.seen_titles: Dict[str, Dict[str, None]] = HistoryStore()
 
     async def start_monitoring(self, competitors: List[str]):
         self.monitoring = True
         while self.monitoring:
-            for competitor in competitors:
-                try:
-                    patents = await self.check_patents(competitor)
-                    analysis = self.analyze_patents(competitor, patents)
-                    if analysis["new_filings"] or analysis["strategic_shift"]:
-                        await self.brain.process_intelligence(self.create_intelligence(competitor, analysis))
-                    self.patent_history[competitor] = patents
-                except Exception:
-                    pass
-                await asyncio.sleep(86400)
+            await asyncio.gather(*(self.scan_competitor(c) for c in competitors))
+            await asyncio.sleep(86400)
+
+    async def scan_competitor(self, competitor: str):
+        try:
+            patents = await self.check_patents(competitor)
+            analysis = await asyncio.to_thread(self.analyze_patents, competitor, patents)
+            if analysis.new_filings or analysis.strategic_shift:
+                await self.brain.process_intelligence(self.create_intelligence(competitor, analysis))
+            self.remember_filings(competitor, analysis)
+        except Exception as e:
+            log.warning("PatentHawk scan failed for %s: %s", competitor, e)
 
     async def check_patents(self, competitor: str) -> List[Dict[str, Any]]:
         # Placeholder demo
-        return [
+        patents = [
             {
                 "title": "System and Method for Distributed AI Processing",
                 "filing_date": (datetime.now() - timedelta(days=30)).isoformat(),
@@ -38,60 +72,56 @@ class PatentHawkHead:
                 "claims_count": 20,
             }
         ]
+        return patents
 
-    def analyze_patents(self, competitor: str, patents: List[Dict[str, Any]]) -> Dict[str, Any]:
-        analysis: Dict[str, Any] = {
-            "total_patents": len(patents),
-            "new_filings": [],
-            "technology_focus": {},
-            "strategic_shift": False,
-            "innovation_velocity": 0,
-            "predicted_products": [],
-            "threat_assessment": "",
-        }
-        if competitor not in self.patent_history:
-            self.patent_history[competitor] = []
-        old_titles = {p.get("title") for p in self.patent_history[competitor]}
+    def analyze_patents(self, competitor: str, patents: List[Dict[str, Any]]) -> PatentAnalysis:
+        analysis = PatentAnalysis(total_patents=len(patents))
+        seen = self.seen_titles.get(competitor, {})
+        batch = set()
         for patent in patents:
-            if patent.get("title") not in old_titles:
-                analysis["new_filings"].append(patent)
-        recent_patents = [p for p in patents if datetime.fromisoformat(p["filing_date"]) > datetime.now() - timedelta(days=180)]
-        analysis["innovation_velocity"] = len(recent_patents) / 6
-        if analysis["innovation_velocity"] > 2:
-            analysis["threat_assessment"] = "HIGH: Rapid innovation pace"
-        elif analysis["new_filings"]:
-            analysis["threat_assessment"] = "MEDIUM: Active filings"
-        else:
-            analysis["threat_assessment"] = "LOW: Normal activity"
+            title = patent.get("title")
+            if title not in seen and title not in batch:
+                batch.add(title)
+                analysis.new_filings.append(patent)
+        cutoff = time.time() - RECENT_WINDOW
+        recent_count = sum(1 for p in patents if filed_epoch(p) > cutoff)
+        analysis.innovation_velocity = recent_count / 6
+        analysis.threat_code = 2 if analysis.innovation_velocity > 2 else int(bool(analysis.new_filings))
+        analysis.threat_assessment = THREAT_ASSESSMENTS[analysis.threat_code]
         return analysis
 
-    def create_intelligence(self, competitor: str, analysis: Dict[str, Any]):
-        threat = "low"
-        if analysis["threat_assessment"].startswith("HIGH"):
-            threat = "high"
-        elif analysis["new_filings"]:
-            threat = "medium"
-        discovery = f"{len(analysis['new_filings'])} new patents filed"
+    def remember_filings(self, competitor: str, analysis: PatentAnalysis):
+        """Mark new filings as seen once they have been reported."""
+        if analysis.new_filings:
+            seen = self.seen_titles.setdefault(competitor, {})
+            seen.update(dict.fromkeys(p.get("title") for p in analysis.new_filings))
+            for _ in range(len(seen) - SEEN_TITLES_MAX):
+                del seen[next(iter(seen))]
+
+    def create_intelligence(self, competitor: str, analysis: PatentAnalysis):
+        threat = THREAT_LEVELS[analysis.threat_code]
+        discovery = f"{len(analysis.new_filings)} new patents filed"
         return {
             "head": self.name,
             "competitor": competitor,
             "discovery": discovery,
             "threat_level": threat,
             "confidence": 0.75,
-            "data": analysis,
+            "data": asdict(analysis),
         }
 
-    def recommend_action(self, analysis: Dict[str, Any]) -> str:
-        if analysis["innovation_velocity"] > 2:
+    def recommend_action(self, analysis: PatentAnalysis) -> str:
+        if analysis.innovation_velocity > 2:
             return "High patent velocity detected. Review R&D budget and innovation strategy."
-        if analysis["new_filings"]:
+        if analysis.new_filings:
             return "Competitor filing patents. Monitor IP landscape and prepare defenses."
         return "Monitor patent portfolio. Update IP strategy."
 
     async def analyze(self, competitor: str) -> Dict[str, Any]:
         patents = await self.check_patents(competitor)
-        analysis = self.analyze_patents(competitor, patents)
-        self.patent_history[competitor] = patents
-        return self.create_intelligence(competitor, analysis)
+        analysis = await asyncio.to_thread(self.analyze_patents, competitor, patents)
+        intelligence = self.create_intelligence(competitor, analysis)
+        self.remember_filings(competitor, analysis)
+        return intelligence
 
 
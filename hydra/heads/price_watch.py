@@ -1,54 +1,139 @@
 import asyncio
+import bisect
+import logging
 import httpx
 from bs4 import BeautifulSoup
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
+import random
 import re
 
 
-from hydra.scrapers import scrape_intelligently
+from hydra.scrapers import HTML_PARSER, HTTP2, scrape_intelligently
+
+log = logging.getLogger(__name__)
+
+PRICE_RE = re.compile(r"[\d.]+")
+# Transient failures worth another try, with exponential backoff between attempts
+RETRY_STATUSES = {429, 503}
+MAX_ATTEMPTS = 4
+MAX_BACKOFF = 30
+# Max absolute change above each tier bumps the threat one level
+THREAT_TIERS = (5, 10, 20)
+THREAT_LEVELS = ("low", "medium", "high", "critical")
+
+
+def percent_change(old: float, new: float) -> float:
+    """Percent change from old to new, 0.0 when there is no baseline price."""
+    return (new - old) / old * 100.0 if old else 0.0
+
+
+def summarize_changes(changes: List[Dict[str, Any]]):
+    """One pass over changes: (largest absolute move, largest drop, any new product)."""
+    max_change = 0.0
+    min_change = 0.0
+    has_new = False
+    for change in changes:
+        pct = change.get("change_percent", 0)
+        max_change = max(max_change, abs(pct))
+        min_change = min(min_change, pct)
+        has_new = has_new or change.get("type") == "new_product"
+    return max_change, min_change, has_new
+
+
+def parse_products(html: bytes) -> Dict[str, Any]:
+    """Extract {name: price info} from a competitor's products page."""
+    soup = BeautifulSoup(html, HTML_PARSER)
+    products: Dict[str, Any] = {}
+    timestamp = datetime.now().isoformat()
+    for item in soup.select("div.product"):
+        name = item.select_one("h3").get_text().strip()
+        price_text = item.select_one("span.price").get_text()
+        price = float(PRICE_RE.search(price_text).group(0))
+        products[name] = {
+            "price": price,
+            "currency": "USD",
+            "timestamp": timestamp,
+            "in_stock": "out of stock" not in item.get_text().lower(),
+        }
+    return products
 
 
 class PriceWatchHead:
     def __init__(self, brain=None):
         self.brain = brain
+        self.own_client: Optional[httpx.AsyncClient] = None
         self.name = "PriceWatch"
         self.monitoring = False
-        self.price_history: Dict[str, Dict[str, Any]] = {}
+        # Only the last seen price per product; it's all detect_changes compares
+        self.price_history: Dict[str, Dict[str, float]] = {}
 
-    async def start_monitoring(self, competitors: List[str]):
+    async def start_monitoring(self, competitors: List[str], max_concurrent: int = 64):
         self.monitoring = True
+        limit = asyncio.Semaphore(max_concurrent)
         while self.monitoring:
-            for competitor in competitors:
-                try:
-                    prices = await self.scrape_prices(competitor)
-                    changes = self.detect_changes(competitor, prices)
-                    if changes:
-                        intel = self.create_intelligence(competitor, changes)
-                        await self.brain.process_intelligence(intel)
-                    self.price_history[competitor] = prices
-                except Exception:
-                    pass
-                await asyncio.sleep(60)
+            await asyncio.gather(*(self.scan_competitor(c, limit) for c in competitors))
+            await asyncio.sleep(60 + random.uniform(0, 15))
 
-    async def scrape_prices(self, competitor: str) -> Dict[str, Any]:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"https://{competitor}/products", headers={"User-Agent": "Mozilla/5.0"}
+    async def scan_competitor(self, competitor: str, limit: asyncio.Semaphore):
+        try:
+            async with limit:
+                prices = await self.scrape_prices(competitor)
+            changes = self.detect_changes(competitor, prices)
+            if changes:
+                intel = self.create_intelligence(competitor, changes)
+                await self.brain.process_intelligence(intel)
+            self.price_history[competitor] = {name: p["price"] for name, p in prices.items()}
+        except Exception as e:
+            log.warning("PriceWatch scan failed for %s: %s", competitor, e)
+
+    def http_client(self) -> httpx.AsyncClient:
+        """The brain's pooled client, or one kept by this head when run on its own."""
+        shared = getattr(self.brain, "http", None)
+        if shared is not None:
+            return shared
+        if self.own_client is None:
+            self.own_client = httpx.AsyncClient(
+                http2=HTTP2,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                timeout=httpx.Timeout(15.0),
             )
-            soup = BeautifulSoup(response.text, "html.parser")
-            products: Dict[str, Any] = {}
-            for item in soup.find_all("div", class_="product"):
-                name = item.find("h3").text.strip()
-                price_text = item.find("span", class_="price").text
-                price = float(re.findall(r"[\d.]+", price_text)[0])
-                products[name] = {
-                    "price": price,
-                    "currency": "USD",
-                    "timestamp": datetime.now().isoformat(),
-                    "in_stock": "out of stock" not in item.text.lower(),
-                }
-            return products
+        return self.own_client
+
+    async def aclose(self):
+        if self.own_client is not None:
+            await self.own_client.aclose()
+            self.own_client = None
+
+    async def stop(self):
+        self.monitoring = False
+        await self.aclose()
+
+    async def get_with_retry(self, url: str) -> httpx.Response:
+        """GET with jittered exponential backoff on transport errors, 429 and 503."""
+        for attempt in range(MAX_ATTEMPTS):
+            final = attempt == MAX_ATTEMPTS - 1
+            delay = min(MAX_BACKOFF, 2 ** attempt) + random.uniform(0, 1)
+            try:
+                response = await self.http_client().get(url, headers={"User-Agent": "Mozilla/5.0"})
+            except httpx.TransportError:
+                if final:
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    return response
+                if final:
+                    # Out of retries; fail the scan rather than parse an error page as "no products"
+                    response.raise_for_status()
+                retry_after = response.headers.get("Retry-After", "")
+                if retry_after.isdigit():
+                    delay = min(int(retry_after), MAX_BACKOFF * 2)
+            await asyncio.sleep(delay)
+
+    async def scrape_prices(self, competitor: str) -> Dict[str, Any]:
+        response = await self.get_with_retry(f"https://{competitor}/products")
+        # Parsing is CPU-bound; keep it off the loop so other scrapes keep moving
+        return await asyncio.to_thread(parse_products, response.content)
 
     def detect_changes(self, competitor: str, current_prices: Dict[str, Any]):
         if competitor not in self.price_history:
@@ -57,33 +142,26 @@ class PriceWatchHead:
         old_prices = self.price_history[competitor]
         for product, current in current_prices.items():
             if product in old_prices:
-                old = old_prices[product]
-                if current["price"] != old["price"]:
-                    change_pct = ((current["price"] - old["price"]) / old["price"]) * 100
+                old_price = old_prices[product]
+                if current["price"] != old_price:
+                    change_pct = percent_change(old_price, current["price"])
                     changes.append(
                         {
                             "product": product,
-                            "old_price": old["price"],
+                            "old_price": old_price,
                             "new_price": current["price"],
                             "change_percent": change_pct,
-                            "direction": "increased" if change_pct > 0 else "decreased",
+                            "direction": "increased" if current["price"] > old_price else "decreased",
                         }
                     )
-        new_products = set(current_prices.keys()) - set(old_prices.keys())
+        new_products = current_prices.keys() - old_prices.keys()
         for product in new_products:
             changes.append({"type": "new_product", "product": product, "price": current_prices[product]["price"]})
         return changes
 
     def create_intelligence(self, competitor: str, changes: List[Dict[str, Any]]):
-        max_change = max([abs(c.get("change_percent", 0)) for c in changes], default=0)
-        if max_change > 20:
-            threat = "critical"
-        elif max_change > 10:
-            threat = "high"
-        elif max_change > 5:
-            threat = "medium"
-        else:
-            threat = "low"
+        max_change, _, _ = summarize_changes(changes)
+        threat = THREAT_LEVELS[bisect.bisect_left(THREAT_TIERS, max_change)]
         discovery = f"Price changes detected: {len(changes)} items affected"
         if max_change > 0:
             discovery += f", max change: {max_change:.1f}%"
@@ -97,15 +175,16 @@ class PriceWatchHead:
         }
 
     def recommend_action(self, changes: List[Dict[str, Any]]) -> str:
-        if any(c.get("change_percent", 0) < -15 for c in changes):
+        _, min_change, has_new = summarize_changes(changes)
+        if min_change < -15:
             return "URGENT: Competitor slashing prices. Consider matching or differentiate on value."
-        if any(c.get("type") == "new_product" for c in changes):
+        if has_new:
             return "New competitor product detected. Analyze features and positioning."
         return "Monitor situation. No immediate action required."
 
     async def analyze(self, competitor: str) -> Dict[str, Any]:
         # Try Bright Data first (while we have credits); falls back automatically
-        data = await scrape_intelligently(f"https://{competitor}/pricing")
+        data = await scrape_intelligently(f"https://{competitor}/pricing", client=self.http_client())
         
         if data.get("source") == "bright_data":
             print(f"💰 Used Bright Data (credits remaining: ${250 - data.get('credits_used', 0):.2f})")